@@ -6,66 +6,706 @@ Pydantic models, and JSON schemas.
 
 Key Features:
 - Extract all text chunks with metadata from documents (bounding boxes, page numbers)
+- Extract only the markdown text when chunk metadata isn't needed
 - Process local PDF/image files directly without base64 encoding
 - Extract structured data using custom Pydantic models with type validation
 - Extract data based on JSON schema definitions with field-level confidence scores
 - Validate JSON schemas against ADE's documented requirements
+- Extract many documents concurrently in a single batch call
+- Cache extraction responses on disk so repeated requests skip the ADE round-trip
 
 Environment Requirements:
 - VISION_AGENT_API_KEY: Required API key from LandingAI for ADE access
+- ADE_CACHE_DIR: Optional directory for cached responses (default: ~/.cache/ade)
+- ADE_MEMORY_CACHE_SIZE: Optional number of responses kept in memory (default: 64)
+- ADE_PARSE_CONCURRENCY: Optional maximum number of documents parsed at the same time (default: 2)
+- ADE_PARSE_PROCESSES: Optional number of worker processes for parses without a Pydantic model (default: 0, use threads)
+- ADE_WARMUP: Optional flag to parse a blank page at startup so the first request starts warm (default: off)
+- ADE_PRETTY_JSON: Optional flag to indent JSON responses for readability (default: off)
 """
 
-from typing import Any, AsyncIterator, Optional, Dict, List, Union
+from typing import Any, AsyncIterator, Callable, Optional, Dict, List, Literal, TextIO, Tuple, Union
 from mcp.server.fastmcp import FastMCP, Context
 from dotenv import load_dotenv
 import os
+import ast
+import atexit
+import binascii
+import hashlib
 import json
-import base64
+import mmap
+import operator
+import tempfile
+import types
+from pathlib import Path
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from contextlib import asynccontextmanager
+from enum import Enum
+from contextlib import asynccontextmanager, redirect_stdout
 import sys
 import asyncio
-from pydantic import BaseModel, Field
+import functools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import orjson
+from pydantic import BaseModel, Field, create_model
+
+# Shared sink for suppressed output. Opened once at import and intentionally never
+# closed, so suppressing output costs no file open/close syscalls per request.
+_DEVNULL = open(os.devnull, 'w')
 
 # CRITICAL: Import agentic-doc with stdout suppressed to prevent config output
 # The agentic-doc library outputs configuration data to stdout on import which
 # breaks MCP protocol communication. We temporarily redirect stdout to /dev/null
 # during the import to prevent this interference.
-old_stdout = sys.stdout
-sys.stdout = open(os.devnull, 'w')
-try:
+with redirect_stdout(_DEVNULL):
     from agentic_doc.parse import parse
-    from agentic_doc.common import ParsedDocument
+    from agentic_doc.common import Chunk, ParsedDocument
     from agentic_doc.config import ParseConfig
-finally:
-    sys.stdout.close()
-    sys.stdout = old_stdout
+    from agentic_doc.utils import is_valid_httpurl
+
+# Protocol stream used by the MCP stdio transport once _redirect_stdio() has run
+_PROTOCOL_STDOUT: Optional[TextIO] = None
 
-class SuppressOutput:
-    """Context manager to suppress stdout and stderr output from the agentic-doc library.
+def _redirect_stdio() -> None:
+    """Silences stdout for the whole process, keeping MCP protocol output intact.
     
     The agentic-doc library produces various status outputs during document processing
-    that can interfere with MCP's stdio-based communication protocol. This context
-    manager temporarily redirects both stdout and stderr to /dev/null to ensure
-    clean MCP communication while preserving the ability to return structured data.
+    (log lines, prints from C code underneath it) that can interfere with MCP's
+    stdio-based communication protocol. Instead of swapping the process-global
+    stream around every parse, which races between concurrent requests, file
+    descriptor 1 is pointed at the shared /dev/null sink once at startup. stderr is
+    not part of the protocol and is left alone, so FastMCP logging and tracebacks
+    still reach the client's log.
     
-    Usage:
-        with SuppressOutput():
-            results = await asyncio.to_thread(parse, document_data)
-    """
-    def __enter__(self):
-        self.old_stdout = sys.stdout
-        self.old_stderr = sys.stderr
-        sys.stdout = open(os.devnull, 'w')
-        sys.stderr = open(os.devnull, 'w')
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        sys.stdout.close()
-        sys.stderr.close()
-        sys.stdout = self.old_stdout
-        sys.stderr = self.old_stderr
-
-def _format_raw_response(result: ParsedDocument) -> Dict[str, Any]:
+    The protocol keeps writing to the original stdout through a private duplicate of
+    fd 1, installed as sys.stdout for the stdio transport to pick up. Once the
+    transport has wrapped it, app_lifespan points sys.stdout at /dev/null as well so
+    Python-level prints are silenced too. Must be called before the server starts.
+    
+    Only the __main__ entry point calls this. Runners that import the module instead
+    (mcp run, mcp dev) never redirect fd 1, so output written below Python's
+    sys.stdout, such as prints from C code, is not silenced there.
+    """
+    global _PROTOCOL_STDOUT
+    sys.stdout.flush()
+    protocol_fd = os.dup(1)
+    os.dup2(_DEVNULL.fileno(), 1)
+    sys.stdout = _PROTOCOL_STDOUT = os.fdopen(protocol_fd, "w", encoding="utf-8")
+
+class _LRUCache(OrderedDict):
+    """Minimal thread-safe bounded mapping that evicts the least recently used entry when full."""
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return self[key]
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self[key] = value
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+# Directory holding cached extraction responses, one JSON file per cache key.
+# Keys are content-addressed (document bytes + extraction config), so entries
+# never go stale and the directory can be safely deleted at any time.
+_CACHE_DIR = Path(os.getenv("ADE_CACHE_DIR", "~/.cache/ade")).expanduser()
+
+def _cache_key(data: Union[bytes, mmap.mmap], config_blob: bytes) -> str:
+    """Computes the content-addressable cache key for a document and its extraction config.
+    
+    Each part is prefixed with its 8-byte big-endian length before hashing so that
+    the document/config boundary is unambiguous (no two different pairs can produce
+    the same hashed byte stream). Responses are cached already serialized, so indented
+    ones (ADE_PRETTY_JSON) get keys of their own and toggling the flag across
+    restarts never serves the other format from the disk cache.
+    
+    Args:
+        data: Raw document bytes (or a read-only memory map of the file)
+        config_blob: Bytes uniquely describing the extraction config (tool, schema, model code)
+        
+    Returns:
+        Hex-encoded SHA-256 digest used as the cache file name
+    """
+    digest = hashlib.sha256()
+    parts = (data, config_blob, b"pretty") if _PRETTY_JSON else (data, config_blob)
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+def _file_cache_key(path: str, config_blob: bytes) -> str:
+    """Computes the cache key for a local file without reading it into memory.
+    
+    The file is memory-mapped so hashing is served from the page cache instead of
+    copying the whole document into a Python bytes object. The mapping is read
+    front to back exactly once, so the kernel is told to read ahead aggressively.
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    with open(path, "rb") as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return _cache_key(b"", config_blob)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return _cache_key(mm, config_blob)
+
+# In-memory tier in front of the disk cache holding the most recently used
+# serialized responses, so hot documents are served without touching the disk.
+# Capped at 16^4 entries regardless of configuration to bound memory use.
+_MEMORY_CACHE = _LRUCache(maxsize=min(int(os.getenv("ADE_MEMORY_CACHE_SIZE", "64")), 16 ** 4))
+
+def _cache_get(key: str) -> Optional[str]:
+    """Returns the cached JSON response for a key, or None on a cache miss."""
+    payload = _MEMORY_CACHE.get(key)
+    if payload is not None:
+        return payload
+    try:
+        payload = (_CACHE_DIR / f"{key}.json").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    _MEMORY_CACHE.put(key, payload)
+    return payload
+
+def _cache_put(key: str, payload: str) -> None:
+    """Stores a JSON response in the memory and disk caches.
+    
+    The payload is written to a temporary file and atomically renamed into place,
+    so concurrent readers never observe a partially written entry. Cache write
+    failures (read-only filesystem, disk full, ...) are ignored since the cache
+    is purely an optimization.
+    """
+    _MEMORY_CACHE.put(key, payload)
+    tmp_path = None
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, _CACHE_DIR / f"{key}.json")
+    except OSError:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+# Opt-in indented output for humans reading responses (e.g. while debugging). Large
+# documents stay compact regardless, since indentation roughly doubles their size.
+_PRETTY_JSON = os.getenv("ADE_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+_PRETTY_JSON_MAX_CHUNKS = 500
+
+def _dumps_default(obj: Any) -> Any:
+    """Converts values orjson can't serialize natively into JSON data.
+    
+    Pydantic models (such as extraction results) are left in the response as-is and
+    dumped here, while orjson walks the response, instead of being converted to dicts
+    up front. Models from pydantic.v1 have no model_dump, so they fall back to dict().
+    Any other value is stringified rather than failing the whole response.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "__fields__") and hasattr(obj, "dict"):
+        return obj.dict()
+    return str(obj)
+
+def _dumps(response: Any, pretty: bool = False) -> str:
+    """Serializes a tool response to a JSON string.
+    
+    Uses orjson's C serializer, compact by default: MCP clients parse the response
+    right back, so pretty-printing only costs CPU time and transport bytes. Pydantic
+    models anywhere in the response are dumped by orjson's default callback, and
+    non-string dict keys are stringified rather than rejected.
+    
+    Args:
+        response: Tool response to serialize
+        pretty: Whether to indent the output by two spaces
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2 if pretty else orjson.OPT_NON_STR_KEYS
+    return orjson.dumps(response, default=_dumps_default, option=option).decode()
+
+def _lookup_base64(pdf_base64: str, config_blob: bytes) -> Tuple[bytes, str, Optional[str]]:
+    """Decodes a base64 document and looks up its cached response.
+    
+    Decoding and hashing are CPU-bound for large documents, so tools run this in a
+    worker thread (one hop for decode + hash + cache read) to keep the event loop
+    free for concurrent tool calls. The string goes straight to binascii's C decoder;
+    base64.b64decode would first copy it into an ASCII bytes object.
+    
+    Returns:
+        Tuple of (decoded document bytes, cache key, cached response or None)
+        
+    Raises:
+        ValueError: If pdf_base64 is not valid base64
+    """
+    try:
+        raw = binascii.a2b_base64(pdf_base64)
+    except binascii.Error as e:
+        raise ValueError(f"Invalid base64 document: {e}") from e
+    cache_key = _cache_key(raw, config_blob)
+    return raw, cache_key, _cache_get(cache_key)
+
+def _lookup_file(path: str, config_blob: bytes) -> Tuple[str, Optional[str]]:
+    """Hashes a local file and looks up its cached response (see _lookup_base64).
+    
+    Returns:
+        Tuple of (cache key, cached response or None)
+    """
+    cache_key = _file_cache_key(path, config_blob)
+    return cache_key, _cache_get(cache_key)
+
+def _lookup_document(pdf_base64: Optional[str], pdf_path: Optional[str], config_blob: bytes) -> Tuple[Union[bytes, str], Optional[str], Optional[str]]:
+    """Resolves a tool's document input and looks up its cached response.
+    
+    A local pdf_path is preferred when given: it is hashed through a memory map and
+    handed to parse() as a path, so large documents are never base64-encoded,
+    decoded, or copied into memory. Both inputs share content-addressed cache keys.
+    http(s) URLs are handed to parse() unchanged, which downloads them; their content
+    can change behind the same URL, so they are never cached.
+    
+    Returns:
+        Tuple of (document bytes or path, cache key or None if the document must not
+        be cached, cached response or None)
+    
+    Raises:
+        ValueError: If neither pdf_base64 nor pdf_path is given
+        FileNotFoundError: If pdf_path doesn't exist
+    """
+    if pdf_path and is_valid_httpurl(pdf_path):
+        return pdf_path, None, None
+    if pdf_path:
+        cache_key, cached = _lookup_file(pdf_path, config_blob)
+        return pdf_path, cache_key, cached
+    if not pdf_base64:
+        raise ValueError("Either pdf_base64 or pdf_path must be provided")
+    return _lookup_base64(pdf_base64, config_blob)
+
+# Pydantic models compiled from user-supplied code, keyed by the SHA-256 of the code.
+# Agents typically resend the same model code on every call, so this skips exec and
+# Pydantic's schema build on repeats.
+_MODEL_CACHE = _LRUCache(maxsize=128)
+
+# Names that model code may reference when it is built from its AST (see
+# _build_model_from_ast). Expressions are restricted to these names, literals and
+# subscripts, so evaluating annotations and defaults cannot run arbitrary code.
+_MODEL_NAMESPACE = {
+    "__builtins__": {},
+    "str": str, "int": int, "float": float, "bool": bool, "bytes": bytes,
+    "list": list, "dict": dict, "tuple": tuple, "set": set,
+    "Any": Any, "Dict": Dict, "List": List, "Literal": Literal,
+    "Optional": Optional, "Tuple": Tuple, "Union": Union,
+}
+
+# Imports that may appear in model code; they are satisfied by _MODEL_NAMESPACE
+_MODEL_IMPORT_MODULES = frozenset({"__future__", "pydantic", "typing"})
+
+# AST node types allowed inside annotations, defaults and Field(...) arguments
+_MODEL_EXPR_NODES = (ast.Name, ast.Load, ast.Constant, ast.Subscript, ast.Tuple, ast.List, ast.BinOp, ast.BitOr)
+
+def _eval_model_expr(node: ast.expr, namespace: Dict[str, Any]) -> Any:
+    """Evaluates an annotation or default expression from model code.
+    
+    Raises:
+        ValueError: If the expression uses anything beyond known names, literals,
+            subscripts (e.g. List[str]) and `X | Y` unions
+    """
+    for child in ast.walk(node):
+        if not isinstance(child, _MODEL_EXPR_NODES) or (isinstance(child, ast.Name) and child.id not in namespace):
+            raise ValueError(f"Unsupported expression: {ast.unparse(node)}")
+    return eval(compile(ast.Expression(node), "<model>", "eval"), namespace)
+
+def _build_model_from_ast(pydantic_model_code: str) -> Optional[type[BaseModel]]:
+    """Builds Pydantic models from plain field declarations without executing the code.
+    
+    The code is parsed with `ast` and every BaseModel subclass consisting only of
+    annotated fields (optionally with literal defaults or Field(...) calls), docstrings
+    and `pass` is rebuilt with `pydantic.create_model`. Class bodies are never run,
+    which is both safer and cheaper than `exec`.
+    
+    Args:
+        pydantic_model_code: Python code defining one or more Pydantic BaseModel classes
+        
+    Returns:
+        The last model defined in the code, or None if the code uses constructs that
+        require real execution (validators, methods, other imports, ...)
+        
+    Raises:
+        SyntaxError: If the code is not valid Python
+    """
+    namespace = dict(_MODEL_NAMESPACE)
+    models = {"BaseModel": BaseModel}
+    extraction_model = None
+    try:
+        for stmt in ast.parse(pydantic_model_code).body:
+            if isinstance(stmt, ast.ImportFrom) and stmt.module in _MODEL_IMPORT_MODULES:
+                continue
+            if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant):
+                continue
+            if not isinstance(stmt, ast.ClassDef) or stmt.keywords or stmt.decorator_list or len(stmt.bases) != 1:
+                return None
+            base = stmt.bases[0]
+            if not isinstance(base, ast.Name) or base.id not in models:
+                return None
+
+            docstring = ast.get_docstring(stmt)
+            fields = {}
+            for item in stmt.body:
+                if isinstance(item, ast.Pass) or (isinstance(item, ast.Expr) and isinstance(item.value, ast.Constant)):
+                    continue
+                if not isinstance(item, ast.AnnAssign) or not isinstance(item.target, ast.Name):
+                    return None
+                annotation = _eval_model_expr(item.annotation, namespace)
+                if isinstance(annotation, str):
+                    # Forward references need the real class namespace
+                    return None
+                value = item.value
+                if value is None:
+                    default = ...
+                elif isinstance(value, ast.Call) and isinstance(value.func, ast.Name) and value.func.id == "Field":
+                    default = Field(
+                        *[_eval_model_expr(arg, namespace) for arg in value.args],
+                        **{kw.arg: _eval_model_expr(kw.value, namespace) for kw in value.keywords if kw.arg}
+                    )
+                else:
+                    default = _eval_model_expr(value, namespace)
+                fields[item.target.id] = (annotation, default)
+
+            extraction_model = create_model(stmt.name, __base__=models[base.id], __doc__=docstring, **fields)
+            models[stmt.name] = namespace[stmt.name] = extraction_model
+    except (ValueError, TypeError):
+        return None
+    return extraction_model
+
+# Imports prepended to model code before it is executed, supporting common Pydantic
+# patterns without the user having to spell them out
+_MODEL_CODE_PREFIX = "from pydantic import Field\nfrom typing import List, Optional\n\n"
+
+@functools.lru_cache(maxsize=512)
+def _compile_model_code(pydantic_model_code: str) -> Tuple[types.CodeType, Optional[str]]:
+    """Compiles model code, with the standard imports prepended, into a code object.
+    
+    The syntax tree is also used to find the name of the extraction model: the last
+    top-level class whose bases include BaseModel (or a model defined earlier in the
+    code). Kept as a second, larger cache tier behind _MODEL_CACHE so that models
+    rebuilt after being evicted (or code that failed to produce a model) skip the
+    parser.
+    
+    Returns:
+        Tuple of (code object, name of the last model class or None if none is found)
+        
+    Raises:
+        SyntaxError: If the code is not valid Python
+    """
+    tree = ast.parse(_MODEL_CODE_PREFIX + pydantic_model_code, "<user_model>")
+    model_names = {"BaseModel"}
+    model_name = None
+    for stmt in tree.body:
+        if isinstance(stmt, ast.ClassDef) and any(
+            (isinstance(base, ast.Name) and base.id in model_names)
+            or (isinstance(base, ast.Attribute) and base.attr == "BaseModel")
+            for base in stmt.bases
+        ):
+            model_names.add(stmt.name)
+            model_name = stmt.name
+    return compile(tree, "<user_model>", "exec"), model_name
+
+def _load_extraction_model(pydantic_model_code: str) -> Optional[type[BaseModel]]:
+    """Compiles Pydantic model code and returns the last BaseModel class it defines.
+    
+    Models made of plain field declarations are built from the AST without running
+    the code; other code is executed with standard Pydantic/typing imports prepended.
+    Compiled models are cached by the hash of the code, so identical code is only
+    executed once.
+    
+    Args:
+        pydantic_model_code: Python code defining one or more Pydantic BaseModel classes
+        
+    Returns:
+        The last BaseModel subclass defined in the code, or None if there is none
+    """
+    code_hash = hashlib.sha256(pydantic_model_code.encode()).hexdigest()
+    extraction_model = _MODEL_CACHE.get(code_hash)
+    if extraction_model is not None:
+        return extraction_model
+
+    # Plain field declarations are built from the AST; anything else (validators,
+    # methods, custom imports) still needs the code to be executed
+    extraction_model = _build_model_from_ast(pydantic_model_code)
+    if extraction_model is not None:
+        _MODEL_CACHE.put(code_hash, extraction_model)
+        return extraction_model
+
+    # Compile the code with the standard imports prepended (cached per code string)
+    code_obj, model_name = _compile_model_code(pydantic_model_code)
+    
+    # Execute the model code in an isolated scope
+    local_scope = {}
+    exec(code_obj, globals(), local_scope)
+    
+    # The last defined Pydantic model is the extraction model; this allows users
+    # to define helper models before the main extraction model. It is looked up by
+    # the name found in the syntax tree, so no scope values have to be probed.
+    extraction_model = local_scope.get(model_name) if model_name else None
+    if not (isinstance(extraction_model, type) and issubclass(extraction_model, BaseModel)):
+        # Models created some other way (or a class name rebound later) fall back to
+        # scanning the scope. Dicts keep insertion order and their views support
+        # reversed() (Python 3.8+), so this walks definitions newest first.
+        extraction_model = None
+        for var in reversed(local_scope.values()):
+            if isinstance(var, type) and issubclass(var, BaseModel) and var is not BaseModel:
+                extraction_model = var
+                break
+
+    if extraction_model is not None:
+        _MODEL_CACHE.put(code_hash, extraction_model)
+    return extraction_model
+
+# Schema validation errors from _validate_schema, keyed by schema digest.
+# Agents usually extract in a loop with one schema, so it is only walked once.
+_SCHEMA_VALIDATION_CACHE = _LRUCache(maxsize=128)
+
+# JSON schema keywords that ADE doesn't support
+_PROHIBITED_KEYWORDS = frozenset({'allOf', 'not', 'dependentRequired', 'dependentSchemas', 'if', 'then', 'else'})
+
+def _schema_json(schema: Dict[str, Any]) -> bytes:
+    """Serializes a JSON schema canonically (sorted keys), so equal schemas give equal bytes."""
+    try:
+        return orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        # orjson rejects integers outside the 64-bit range, which json handles fine
+        return json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+def _schema_digest(schema: Dict[str, Any]) -> str:
+    """Returns a short digest of a JSON schema that is independent of key order."""
+    return hashlib.blake2b(_schema_json(schema), digest_size=16).hexdigest()
+
+def _validate_schema(schema: Dict[str, Any]) -> Tuple[str, ...]:
+    """Checks a JSON schema against ADE's documented requirements.
+    
+    This is the validation core shared by ade_validate_json_schema and the schema
+    extraction tools, which call it directly instead of going through the tool
+    and parsing its formatted verdict. Results are cached by schema digest, so
+    extracting in a loop with one schema only walks it once.
+    
+    Args:
+        schema: JSON schema dictionary to validate
+        
+    Returns:
+        Tuple of rule violations, empty if the schema is valid
+    """
+    # Identical schemas always produce the same errors
+    schema_key = _schema_digest(schema)
+    cached = _SCHEMA_VALIDATION_CACHE.get(schema_key)
+    if cached is not None:
+        return cached
+
+    # Errors are collected in a set since the same violation can be reached more than once
+    errors = set()
+    
+    # Check top-level type requirement
+    if schema.get("type") != "object":
+        errors.add("Rule Broken: Top-level 'type' must be 'object'.")
+
+    # Walk the schema with an explicit stack of (node, path, depth) entries
+    # instead of recursion; each node is visited exactly once
+    stack = deque([(schema, "root", 1)])
+    while stack:
+        obj, path, depth = stack.pop()
+
+        # Check depth limit
+        if depth > 5:
+            errors.add(f"Rule Broken: Schema depth exceeds 5 at path '{path}'.")
+            continue
+
+        if isinstance(obj, dict):
+            # Node-level checks run once per dict, not once per key
+            obj_type = obj.get("type")
+
+            # Check object has properties
+            if obj_type == "object" and "properties" not in obj:
+                errors.add(f"Rule Broken: Object at path '{path}' must have a 'properties' field.")
+
+            # Check array has items
+            if obj_type == "array" and "items" not in obj:
+                errors.add(f"Rule Broken: Array at path '{path}' must have an 'items' field.")
+
+            # Check for invalid type arrays
+            if isinstance(obj_type, list) and any(t in obj_type for t in ["object", "array"]):
+                errors.add(f"Rule Broken: Type array at path '{path}.type' cannot contain 'object' or 'array'. Use 'anyOf' instead.")
+
+            # Check for prohibited keywords with one set intersection per dict
+            for key in obj.keys() & _PROHIBITED_KEYWORDS:
+                errors.add(f"Rule Broken: Prohibited keyword '{key}' found at path '{path}.{key}'.")
+
+            # Descend into nested structures. Scalar leaves only matter when they
+            # exceed the depth limit, so most never get a path string or stack entry.
+            for key, value in obj.items():
+                if depth >= 5 or isinstance(value, (dict, list)):
+                    stack.append((value, f"{path}.{key}", depth + 1))
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                if depth >= 5 or isinstance(item, (dict, list)):
+                    stack.append((item, f"{path}[{i}]", depth + 1))
+
+    result = tuple(errors)
+    _SCHEMA_VALIDATION_CACHE.put(schema_key, result)
+    return result
+
+def _format_schema_errors(errors: Tuple[str, ...]) -> str:
+    """Formats schema rule violations as the validation failure message."""
+    # Duplicates were already dropped while validating
+    error_list = "\n".join(f"- {e}" for e in errors)
+    return f"❌ Schema validation failed:\n{error_list}"
+
+# ParseConfig objects are shared across requests, so repeat extractions reuse one
+# config instead of building it again. Schemas are keyed by their canonical JSON, which the tools already
+# need for the response cache key; models by the class itself rather than its id(),
+# so an evicted model's id can never be reused.
+@functools.lru_cache(maxsize=128)
+def _schema_parse_config(schema_json: bytes) -> ParseConfig:
+    """Returns the (cached) ParseConfig for a JSON extraction schema given as canonical JSON."""
+    # json rather than orjson, which would turn integers beyond 64 bits into floats;
+    # this only runs once per schema
+    return ParseConfig(extraction_schema=json.loads(schema_json))
+
+@functools.lru_cache(maxsize=128)
+def _model_parse_config(extraction_model: type[BaseModel]) -> ParseConfig:
+    """Returns the (cached) ParseConfig for a Pydantic extraction model."""
+    return ParseConfig(extraction_model=extraction_model)
+
+# Dedicated worker threads for ADE parse calls. Parsing blocks for seconds at a time,
+# so it gets its own pool instead of sharing (and exhausting) asyncio's default
+# executor, which handles the short decode/hash/cache hops. Each parse renders pages
+# and fans out its own requests, holding hundreds of MB, so the pool is kept small and
+# every worker parses a single document at a time: bursts of tool calls queue here
+# instead of running the server out of memory.
+# The pool is shared by every client session, so it is only shut down at process exit.
+_ADE_POOL = ThreadPoolExecutor(max_workers=int(os.getenv("ADE_PARSE_CONCURRENCY", "2")), thread_name_prefix="ade")
+atexit.register(_ADE_POOL.shutdown, wait=True, cancel_futures=True)
+
+# Optional worker processes for parses without a Pydantic model. agentic-doc builds
+# chunk objects and responses are formatted in Python, all holding the GIL, so busy
+# servers can spread that work over separate interpreters. Off by default: every
+# worker imports the whole server, and models built from user code can't be pickled
+# into another process, so Pydantic extractions always stay on the thread pool.
+# The pool is started on first use and shared by all client sessions until process exit.
+_PARSE_PROCESSES = int(os.getenv("ADE_PARSE_PROCESSES", "0"))
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Returns the parse worker process pool, creating it on first use."""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        # Spawned rather than forked: the server process runs threads and an event loop
+        _PROCESS_POOL = ProcessPoolExecutor(
+            max_workers=_PARSE_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_worker_init
+        )
+        atexit.register(_PROCESS_POOL.shutdown, wait=True, cancel_futures=True)
+    return _PROCESS_POOL
+
+def _worker_init() -> None:
+    """Initializes a parse worker process.
+    
+    agentic-doc is imported together with this module, so workers only have to
+    silence their output: stdout is pointed at /dev/null so nothing written by the
+    library can reach the MCP protocol stream of the server. stderr is inherited from
+    the server and left alone, like in _redirect_stdio().
+    """
+    sys.stdout.flush()
+    os.dup2(_DEVNULL.fileno(), 1)
+    sys.stdout = _DEVNULL
+
+def _parse_and_render(document: Union[bytes, str], config_obj: Optional[ParseConfig], formatter: Callable[[ParsedDocument], Any]) -> Optional[Tuple[bool, str]]:
+    """Parses a document and serializes the result to its JSON response.
+    
+    Formatting and serialization walk every chunk of the document, so they run in
+    the same worker as parse() instead of blocking the event loop. Only plain
+    values are returned, so the result can be sent back from a worker process.
+    
+    Args:
+        document: Raw document bytes or a local file path
+        config_obj: Optional extraction config (schema or Pydantic model)
+        formatter: Function turning the ParsedDocument into the tool response
+        
+    Returns:
+        Tuple of (cacheable, JSON payload), where cacheable is False if the document
+        had page or extraction errors, or None if parse() returned no results
+    """
+    results = parse(document, config=config_obj)
+    if not results:
+        return None
+    result = results[0]
+    return (
+        not result.errors and not result.extraction_error,
+        _dumps(formatter(result), pretty=_PRETTY_JSON and len(result.chunks) <= _PRETTY_JSON_MAX_CHUNKS)
+    )
+
+async def _parse_in_pool(document: Union[bytes, str], config_obj: Optional[ParseConfig], formatter: Callable[[ParsedDocument], Any]) -> Optional[Tuple[bool, str]]:
+    """Runs _parse_and_render() on the dedicated ADE thread pool, or in a worker process.
+    
+    Worker processes are used when enabled and the config carries no Pydantic model;
+    the formatter must then be picklable (a module-level function or a partial of one).
+    
+    Args:
+        document: Raw document bytes or a local file path
+        config_obj: Optional extraction config (schema or Pydantic model)
+        formatter: Function turning the ParsedDocument into the tool response
+        
+    Returns:
+        Tuple of (cacheable, JSON payload), or None if parse() returned no results
+    """
+    executor = _ADE_POOL
+    if _PARSE_PROCESSES > 0 and (config_obj is None or config_obj.extraction_model is None):
+        executor = _get_process_pool()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _parse_and_render, document, config_obj, formatter)
+
+# Chunks share one shape per agentic-doc version, so whether chunk_type is an enum
+# (read through .value) is decided once at import from the Chunk model rather than
+# probed on every document
+_CHUNK_TYPE_ANNOTATION = Chunk.model_fields["chunk_type"].annotation
+_CHUNK_TYPE_IS_ENUM = isinstance(_CHUNK_TYPE_ANNOTATION, type) and issubclass(_CHUNK_TYPE_ANNOTATION, Enum)
+if _CHUNK_TYPE_IS_ENUM:
+    _chunk_type_of = operator.attrgetter("chunk_type.value")
+else:
+    _chunk_type_of = lambda chunk: str(chunk.chunk_type)
+
+# Opt-in warmup parse at startup. The first parse pays for connection setup and TLS to
+# the ADE backend (and for starting a worker process, when those are enabled), so a
+# blank page is parsed in the background while the server waits for its first
+# request. Off by default because the warmup page is billed like any other.
+_WARMUP = os.getenv("ADE_WARMUP", "").lower() in ("1", "true", "yes")
+_WARMUP_STARTED = False
+
+# Minimal valid single-page blank PDF (US Letter) used for the warmup parse
+_WARMUP_PDF = binascii.a2b_base64(
+    b"JVBERi0xLjQKMSAwIG9iago8PC9UeXBlL0NhdGFsb2cvUGFnZXMgMiAwIFI+PgplbmRvYmoKMiAwIG9i"
+    b"ago8PC9UeXBlL1BhZ2VzL0tpZHNbMyAwIFJdL0NvdW50IDE+PgplbmRvYmoKMyAwIG9iago8PC9UeXBl"
+    b"L1BhZ2UvUGFyZW50IDIgMCBSL01lZGlhQm94WzAgMCA2MTIgNzkyXT4+CmVuZG9iagp4cmVmCjAgNAow"
+    b"MDAwMDAwMDAwIDY1NTM1IGYgCjAwMDAwMDAwMDkgMDAwMDAgbiAKMDAwMDAwMDA1NCAwMDAwMCBuIAow"
+    b"MDAwMDAwMTA1IDAwMDAwIG4gCnRyYWlsZXIKPDwvU2l6ZSA0L1Jvb3QgMSAwIFI+PgpzdGFydHhyZWYK"
+    b"MTcwCiUlRU9GCg=="
+)
+
+async def _warmup() -> None:
+    """Parses the blank warmup PDF once, ignoring any failure."""
+    try:
+        await _parse_in_pool(_WARMUP_PDF, None, functools.partial(_format_raw_response, include_chunks=False))
+    except Exception:
+        pass
+
+def _format_raw_response(result: ParsedDocument, include_chunks: bool = True) -> Dict[str, Any]:
     """Formats raw extraction results from ParsedDocument into a structured JSON response.
     
     This helper function transforms the ADE ParsedDocument object into a more readable
@@ -74,11 +714,13 @@ def _format_raw_response(result: ParsedDocument) -> Dict[str, Any]:
     
     Args:
         result: ParsedDocument object from agentic-doc containing extraction results
+        include_chunks: Whether to format the chunk list; when False chunk formatting
+            is skipped entirely and "chunks" is None
         
     Returns:
         Dictionary containing:
         - markdown: Complete extracted text in markdown format
-        - chunks: List of text chunks with:
+        - chunks: List of text chunks (or None if include_chunks is False) with:
             - type: Chunk type (e.g., 'text', 'table', 'header')
             - content: The actual text content of the chunk
             - page: Page number where chunk appears
@@ -87,19 +729,159 @@ def _format_raw_response(result: ParsedDocument) -> Dict[str, Any]:
                 - bbox: Dictionary with left, top, right, bottom coordinates
                 - page: Page number for this bounding box
     """
+    if not include_chunks:
+        return {"markdown": result.markdown, "chunks": None}
+
+    chunks = result.chunks
+    if not chunks:
+        return {"markdown": result.markdown, "chunks": []}
+
+    # Plain loops with local bindings; this is the hottest loop for large documents
+    chunk_type_of = _chunk_type_of
+    formatted_chunks = []
+    append_chunk = formatted_chunks.append
+    for chunk in chunks:
+        grounding = []
+        for g in chunk.grounding or ():
+            box = g.box
+            grounding.append({"bbox": {"l": box.l, "t": box.t, "r": box.r, "b": box.b}, "page": g.page})
+        append_chunk({
+            "type": chunk_type_of(chunk),
+            "content": chunk.text,
+            "page": grounding[0]["page"] if grounding else None,
+            "chunk_id": chunk.chunk_id,
+            "grounding": grounding
+        })
+
+    return {"markdown": result.markdown, "chunks": formatted_chunks}
+
+# Per-field metadata reported in field_details, read with a single C-level attrgetter
+_FIELD_DETAIL_KEYS = ("confidence", "raw_text", "chunk_references")
+_get_field_detail = operator.attrgetter(*_FIELD_DETAIL_KEYS)
+
+def _format_field_details(extraction_metadata: Any) -> Dict[str, Dict[str, Any]]:
+    """Formats per-field extraction metadata for structured extraction responses.
+    
+    Args:
+        extraction_metadata: Mapping of field name to metadata from a ParsedDocument
+        
+    Returns:
+        Dictionary mapping each field to its confidence, raw_text and chunk_references
+    """
+    if not extraction_metadata:
+        return {}
     return {
-        "markdown": result.markdown,
-        "chunks": [
-            {
-                "type": chunk.chunk_type.value if hasattr(chunk, 'chunk_type') and hasattr(chunk.chunk_type, 'value') else str(chunk.chunk_type),
-                "content": chunk.text,
-                "page": chunk.grounding[0].page if chunk.grounding else None,
-                "chunk_id": chunk.chunk_id,
-                "grounding": [{"bbox": {"l": g.box.l, "t": g.box.t, "r": g.box.r, "b": g.box.b}, "page": g.page} for g in chunk.grounding] if chunk.grounding else []
-            } for chunk in result.chunks
-        ]
+        field: dict(zip(_FIELD_DETAIL_KEYS, _get_field_detail(meta)))
+        for field, meta in extraction_metadata.items() if meta
     }
 
+def _format_schema_response(result: ParsedDocument) -> Dict[str, Any]:
+    """Formats JSON-schema extraction results from ParsedDocument into a structured JSON response.
+    
+    Args:
+        result: ParsedDocument object from agentic-doc produced with an extraction schema
+        
+    Returns:
+        Dictionary containing:
+        - extraction_error: Any errors during extraction (None if successful)
+        - extracted_data: JSON object matching the provided schema
+        - field_details: Metadata for each extracted field (confidence, raw_text, chunk_references)
+    """
+    return {
+        "extraction_error": result.extraction_error,
+        "extracted_data": result.extraction,
+        "field_details": _format_field_details(result.extraction_metadata)
+    }
+
+def _format_path_response(path: str, result: ParsedDocument) -> Dict[str, Any]:
+    """Formats raw extraction results for a local file, echoing back its path.
+    
+    Args:
+        path: Path of the parsed file as given by the caller
+        result: ParsedDocument object from agentic-doc containing extraction results
+        
+    Returns:
+        Dictionary containing the file_path and the raw extraction_result
+    """
+    return {
+        "file_path": getattr(result, 'source', path),
+        "extraction_result": _format_raw_response(result)
+    }
+
+def _format_pydantic_response(result: ParsedDocument) -> Dict[str, Any]:
+    """Formats Pydantic-model extraction results from ParsedDocument into a structured JSON response.
+    
+    Args:
+        result: ParsedDocument object from agentic-doc produced with an extraction model
+        
+    Returns:
+        Dictionary containing:
+        - extraction_error: Any errors during extraction (None if successful)
+        - extracted_data: The extraction model instance, dumped by _dumps during serialization
+        - field_details: Metadata for each extracted field (confidence, raw_text, chunk_references)
+    """
+    return {
+        "extraction_error": result.extraction_error,
+        "extracted_data": result.extraction or None,
+        "field_details": _format_field_details(result.extraction_metadata)
+    }
+
+async def _run_parse(
+    pdf_base64: Optional[str],
+    pdf_path: Optional[str],
+    config_blob: bytes,
+    *,
+    config: Union[ParseConfig, Callable[[], Optional[ParseConfig]], None] = None,
+    formatter: Callable[[ParsedDocument], Any] = _format_raw_response,
+    task: str = "extraction",
+    no_results: str = "❌ No results returned",
+    no_config: Optional[str] = None
+) -> str:
+    """Runs a single-document extraction end to end for the extraction tools.
+    
+    Owns the shared request path: response cache lookup, the parse on the
+    ADE workers (where the response is also formatted and serialized), caching of
+    successful responses and error reporting, so every tool gets the same behavior.
+    
+    Args:
+        pdf_base64: Base64-encoded document content, used when pdf_path is not given
+        pdf_path: Local path to the document
+        config_blob: Bytes uniquely describing the extraction config for the cache key
+        config: Extraction config, or a function building it that is only called on a
+            cache miss (so model code isn't compiled for cached responses)
+        formatter: Function turning the ParsedDocument into the tool response
+        task: Name of the extraction used in error messages
+        no_results: Message returned when parse() comes back empty
+        no_config: Message returned when the config function finds no config
+        
+    Returns:
+        The JSON response, or an error message
+    """
+    try:
+        # Read the path or decode base64 off the event loop, serving repeat documents from the cache
+        try:
+            document, cache_key, cached = await asyncio.to_thread(_lookup_document, pdf_base64, pdf_path, config_blob)
+        except FileNotFoundError:
+            return f"❌ File not found: {pdf_path}"
+        if cached is not None:
+            return cached
+
+        # Parse document and format the response in the ADE worker thread
+        config_obj = config() if callable(config) else config
+        if config_obj is None and no_config is not None:
+            return no_config
+        rendered = await _parse_in_pool(document, config_obj, formatter)
+        if not rendered: return no_results
+        
+        cacheable, payload = rendered
+        if cacheable and cache_key:
+            # Writing a large response to disk would block the event loop
+            await asyncio.to_thread(_cache_put, cache_key, payload)
+        return payload
+    except Exception as e:
+        return f"Error during {task}: {str(e)}"
+
+@functools.cache
 def load_environment_variables() -> None:
     """Loads and validates required environment variables from .env file.
     
@@ -107,6 +889,9 @@ def load_environment_variables() -> None:
     and validates that the required VISION_AGENT_API_KEY is present. This key is
     necessary for authenticating with LandingAI's ADE API.
     
+    Successful calls are cached, so the .env file is only read and parsed once per
+    process no matter how often the server module is imported or initialized.
+    
     Raises:
         ValueError: If VISION_AGENT_API_KEY environment variable is not set
         
@@ -142,16 +927,34 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     Yields:
         AppContext: Application context for the server session
     """
-    # Server initialization logic would go here
-    yield AppContext()
-    # Server cleanup logic would go here
+    # Load and validate the API key here too, so runners that import the module
+    # rather than executing it (other transports, notebooks) share one startup
+    # path; repeat calls are free since the result is cached
+    load_environment_variables()
+    if sys.stdout is _PROTOCOL_STDOUT:
+        # The stdio transport has already wrapped the protocol stream, so any
+        # other Python-level print() can now go to /dev/null
+        sys.stdout = _DEVNULL
+    # Not awaited: the warmup races the first real request instead of delaying startup.
+    # Only the first session warms up, since the lifespan runs per session on SSE and HTTP.
+    global _WARMUP_STARTED
+    warmup_task = None
+    if _WARMUP and not _WARMUP_STARTED:
+        _WARMUP_STARTED = True
+        warmup_task = asyncio.create_task(_warmup())
+    try:
+        yield AppContext()
+    finally:
+        # The parse pools are shared with other sessions and stay up
+        if warmup_task is not None:
+            warmup_task.cancel()
 
 # Initialize the FastMCP server with the ADE server name and lifecycle manager
 # This creates the MCP server instance that will handle tool registrations and requests
 mcp = FastMCP("ade-server", lifespan=app_lifespan)
 
 @mcp.tool()
-async def ade_extract_raw_chunks(ctx: Context, pdf_base64: str) -> str:
+async def ade_extract_raw_chunks(ctx: Context, pdf_base64: Optional[str] = None, pdf_path: Optional[str] = None) -> str:
     """Extracts all raw text chunks and their metadata from a base64-encoded document.
     
     This tool performs comprehensive text extraction from documents without any
@@ -163,7 +966,8 @@ async def ade_extract_raw_chunks(ctx: Context, pdf_base64: str) -> str:
     
     Args:
         ctx: MCP context object (provided by framework)
-        pdf_base64: Base64-encoded PDF or image file content
+        pdf_base64: Base64-encoded PDF or image file content (omit when pdf_path is given)
+        pdf_path: Optional local path to the document, preferred over pdf_base64 for large files
         
     Returns:
         JSON string containing:
@@ -184,15 +988,31 @@ async def ade_extract_raw_chunks(ctx: Context, pdf_base64: str) -> str:
           ]
         }
     """
-    try:
-        # Decode base64 and parse document with output suppressed
-        with SuppressOutput():
-            results = await asyncio.to_thread(parse, base64.b64decode(pdf_base64))
-        if not results: return "❌ No results returned"
-        response = _format_raw_response(results[0])
-        return json.dumps(response, indent=2)
-    except Exception as e:
-        return f"Error during raw extraction: {str(e)}"
+    return await _run_parse(pdf_base64, pdf_path, b"raw", task="raw extraction")
+
+@mcp.tool()
+async def ade_extract_markdown_only(ctx: Context, pdf_base64: Optional[str] = None, pdf_path: Optional[str] = None) -> str:
+    """Extracts only the markdown text from a base64-encoded document.
+    
+    A lighter variant of ade_extract_raw_chunks for when only the document text
+    is needed: chunk formatting is skipped entirely, so responses stay small even
+    for documents with thousands of chunks.
+    
+    Args:
+        ctx: MCP context object (provided by framework)
+        pdf_base64: Base64-encoded PDF or image file content (omit when pdf_path is given)
+        pdf_path: Optional local path to the document, preferred over pdf_base64 for large files
+        
+    Returns:
+        JSON string containing:
+        - markdown: Complete document text in markdown format
+        - chunks: Always null
+    """
+    return await _run_parse(
+        pdf_base64, pdf_path, b"markdown",
+        formatter=functools.partial(_format_raw_response, include_chunks=False),
+        task="markdown extraction"
+    )
 
 @mcp.tool()
 async def ade_extract_from_path(ctx: Context, path: str) -> str:
@@ -206,7 +1026,7 @@ async def ade_extract_from_path(ctx: Context, path: str) -> str:
     
     Args:
         ctx: MCP context object (provided by framework)
-        path: Absolute or relative file path to the document
+        path: Absolute or relative file path to the document, or an http(s) URL
         
     Returns:
         JSON string containing:
@@ -223,25 +1043,16 @@ async def ade_extract_from_path(ctx: Context, path: str) -> str:
         path = "/Users/john/Documents/invoice.pdf"
         result = await ade_extract_from_path(ctx, path)
     """
-    try:
-        # Parse document directly from file path
-        with SuppressOutput():
-            results = await asyncio.to_thread(parse, path)
-        if not results: return "❌ No results returned"
-        
-        result = results[0]
-        response = {
-            "file_path": getattr(result, 'source', path),
-            "extraction_result": _format_raw_response(result)
-        }
-        return json.dumps(response, indent=2)
-    except FileNotFoundError:
-        return f"❌ File not found: {path}"
-    except Exception as e:
-        return f"Error during file path extraction: {str(e)}"
+    # The path is part of the config since it is echoed back in the response. Parsing
+    # straight from the path means the document is never copied into memory at all.
+    return await _run_parse(
+        None, path, f"path:{os.path.abspath(path)}".encode(),
+        formatter=functools.partial(_format_path_response, path),
+        task="file path extraction"
+    )
 
 @mcp.tool()
-async def ade_extract_with_pydantic(ctx: Context, pdf_base64: str, pydantic_model_code: str) -> str:
+async def ade_extract_with_pydantic(ctx: Context, pdf_base64: Optional[str] = None, *, pydantic_model_code: str, pdf_path: Optional[str] = None) -> str:
     """Extracts structured data from documents using a custom Pydantic model definition.
     
     This tool allows you to define a Pydantic BaseModel as Python code, which will be
@@ -256,8 +1067,9 @@ async def ade_extract_with_pydantic(ctx: Context, pdf_base64: str, pydantic_mode
     
     Args:
         ctx: MCP context object (provided by framework)
-        pdf_base64: Base64-encoded PDF or image file content
+        pdf_base64: Base64-encoded PDF or image file content (omit when pdf_path is given)
         pydantic_model_code: Python code defining a Pydantic BaseModel class
+        pdf_path: Optional local path to the document, preferred over pdf_base64 for large files
         
     Returns:
         JSON string containing:
@@ -280,49 +1092,20 @@ async def ade_extract_with_pydantic(ctx: Context, pdf_base64: str, pydantic_mode
     - Standard Pydantic imports are automatically added
     - Field descriptions help improve extraction accuracy
     """
-    try:
-        # Prepare the code for execution with necessary imports
-        # These imports are automatically added to support common Pydantic patterns
-        full_code = f"from pydantic import BaseModel, Field\nfrom typing import List, Optional\n\n{pydantic_model_code}"
-        
-        # Execute the model code in an isolated scope
-        local_scope = {}
-        exec(full_code, globals(), local_scope)
-        
-        # Find the last defined Pydantic model in the executed code
-        # This allows users to define helper models before the main extraction model
-        extraction_model = None
-        for var in reversed(local_scope.values()):
-            if isinstance(var, type) and issubclass(var, BaseModel) and var is not BaseModel:
-                extraction_model = var
-                break
-        
-        if not extraction_model:
-            return "❌ No Pydantic BaseModel class found in the provided code."
-
-        # Configure and execute extraction with the Pydantic model
-        config_obj = ParseConfig(extraction_model=extraction_model)
-        with SuppressOutput():
-            results = await asyncio.to_thread(parse, base64.b64decode(pdf_base64), config=config_obj)
-        if not results: return "❌ No results returned from parsing."
-        
-        # Format response with extracted data and metadata
-        result = results[0]
-        response = {
-            "extraction_error": result.extraction_error,
-            "extracted_data": result.extraction.dict() if result.extraction else None,
-            "field_details": {
-                field: {
-                    "confidence": meta.confidence,
-                    "raw_text": meta.raw_text,
-                    "chunk_references": meta.chunk_references
-                } for field, meta in result.extraction_metadata.items() if meta
-            } if result.extraction_metadata else {}
-        }
-        return json.dumps(response, indent=2)
+    def model_config() -> Optional[ParseConfig]:
+        # Compile the model code (or reuse the model compiled for identical code); only
+        # called on a cache miss, so cached responses never run the model code
+        extraction_model = _load_extraction_model(pydantic_model_code)
+        return _model_parse_config(extraction_model) if extraction_model else None
 
-    except Exception as e:
-        return f"Error during Pydantic-based extraction: {str(e)}"
+    return await _run_parse(
+        pdf_base64, pdf_path, f"pydantic:{pydantic_model_code}".encode(),
+        config=model_config,
+        formatter=_format_pydantic_response,
+        task="Pydantic-based extraction",
+        no_results="❌ No results returned from parsing.",
+        no_config="❌ No Pydantic BaseModel class found in the provided code."
+    )
 
 @mcp.tool()
 async def ade_validate_json_schema(ctx: Context, schema: Dict[str, Any]) -> str:
@@ -372,61 +1155,13 @@ async def ade_validate_json_schema(ctx: Context, schema: Dict[str, Any]) -> str:
     - Exceeding 5 levels of nesting
     - Using type arrays with mixed complex/primitive types
     """
-    errors = []
-    
-    # Check top-level type requirement
-    if schema.get("type") != "object":
-        errors.append("Rule Broken: Top-level 'type' must be 'object'.")
-
-    # Define keywords that ADE doesn't support
-    prohibited_keywords = {'allOf', 'not', 'dependentRequired', 'dependentSchemas', 'if', 'then', 'else'}
-
-    def traverse(obj, path, depth):
-        """Recursively traverse schema to check for violations."""
-        # Check depth limit
-        if depth > 5:
-            errors.append(f"Rule Broken: Schema depth exceeds 5 at path '{path}'.")
-            return
-
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                new_path = f"{path}.{key}"
-                
-                # Check for prohibited keywords
-                if key in prohibited_keywords:
-                    errors.append(f"Rule Broken: Prohibited keyword '{key}' found at path '{new_path}'.")
-                
-                # Check for invalid type arrays
-                if key == "type" and isinstance(value, list) and any(t in value for t in ["object", "array"]):
-                    errors.append(f"Rule Broken: Type array at path '{new_path}' cannot contain 'object' or 'array'. Use 'anyOf' instead.")
-
-                # Check object has properties
-                if obj.get("type") == "object" and "properties" not in obj:
-                     errors.append(f"Rule Broken: Object at path '{path}' must have a 'properties' field.")
-                
-                # Check array has items
-                if obj.get("type") == "array" and "items" not in obj:
-                     errors.append(f"Rule Broken: Array at path '{path}' must have an 'items' field.")
-                
-                # Recurse into nested structures
-                traverse(value, new_path, depth + 1)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                traverse(item, f"{path}[{i}]", depth + 1)
-
-    # Start traversal from root
-    traverse(schema, "root", 1)
-    
-    # Return validation results
+    errors = _validate_schema(schema)
     if not errors:
         return "✅ Schema is valid according to ADE documentation rules."
-    else:
-        # Remove duplicates and format error list
-        error_list = "\n".join(f"- {e}" for e in set(errors))
-        return f"❌ Schema validation failed:\n{error_list}"
+    return _format_schema_errors(errors)
 
 @mcp.tool()
-async def ade_extract_with_json_schema(ctx: Context, pdf_base64: str, schema: Dict[str, Any]) -> str:
+async def ade_extract_with_json_schema(ctx: Context, pdf_base64: Optional[str] = None, *, schema: Dict[str, Any], pdf_path: Optional[str] = None) -> str:
     """Extracts structured data from documents based on a JSON schema definition.
     
     This tool provides schema-based extraction without needing to write Python code.
@@ -442,8 +1177,9 @@ async def ade_extract_with_json_schema(ctx: Context, pdf_base64: str, schema: Di
     
     Args:
         ctx: MCP context object (provided by framework)
-        pdf_base64: Base64-encoded PDF or image file content
+        pdf_base64: Base64-encoded PDF or image file content (omit when pdf_path is given)
         schema: JSON schema dictionary defining the expected structure
+        pdf_path: Optional local path to the document, preferred over pdf_base64 for large files
         
     Returns:
         JSON string containing:
@@ -492,33 +1228,109 @@ async def ade_extract_with_json_schema(ctx: Context, pdf_base64: str, schema: Di
     try:
         # Always validate schema before attempting extraction
         # This prevents wasted API calls and provides clear error messages
-        validation_result = await ade_validate_json_schema(ctx, schema)
-        if "❌" in validation_result:
-            return f"Schema validation failed. Please fix the schema before extraction.\n{validation_result}"
-
-        # Configure extraction with the validated schema
-        config_obj = ParseConfig(extraction_schema=schema)
-        with SuppressOutput():
-            results = await asyncio.to_thread(parse, base64.b64decode(pdf_base64), config=config_obj)
-        if not results: return "❌ No results returned."
-        
-        # Format the extraction results with metadata
-        result = results[0]
-        response = {
-            "extraction_error": result.extraction_error,
-            "extracted_data": result.extraction,
-            "field_details": {
-                field: {
-                    "confidence": meta.confidence, 
-                    "raw_text": meta.raw_text, 
-                    "chunk_references": meta.chunk_references
-                } for field, meta in result.extraction_metadata.items() if meta
-            } if result.extraction_metadata else {}
-        }
-        return json.dumps(response, indent=2)
+        errors = _validate_schema(schema)
+        if errors:
+            return f"Schema validation failed. Please fix the schema before extraction.\n{_format_schema_errors(errors)}"
+        schema_json = _schema_json(schema)
     except Exception as e:
         return f"Error during JSON schema extraction: {str(e)}"
 
+    return await _run_parse(
+        pdf_base64, pdf_path, b"schema:" + schema_json,
+        config=_schema_parse_config(schema_json),
+        formatter=_format_schema_response,
+        task="JSON schema extraction",
+        no_results="❌ No results returned."
+    )
+
+@mcp.tool()
+async def ade_extract_batch(ctx: Context, pdf_base64_list: List[str], schema: Optional[Dict[str, Any]] = None, max_concurrency: int = 8) -> str:
+    """Extracts data from multiple base64-encoded documents concurrently.
+    
+    ADE extraction is network-bound, so submitting documents concurrently reduces
+    the wall time for N documents from roughly N round-trips to N / concurrency
+    (up to max_concurrency in-flight requests, further bounded server-wide by
+    ADE_PARSE_CONCURRENCY). Without a schema each document is
+    processed like ade_extract_raw_chunks; with a schema each document is
+    processed like ade_extract_with_json_schema. Progress is reported to the
+    client as each document completes.
+    
+    Args:
+        ctx: MCP context object (provided by framework)
+        pdf_base64_list: List of base64-encoded PDF or image file contents
+        schema: Optional JSON schema dictionary applied to every document
+        max_concurrency: Maximum number of documents processed at the same time
+        
+    Returns:
+        JSON array with one entry per input document, in input order. Each entry is
+        either the same response as the corresponding single-document tool, or
+        {"error": "..."} if that document failed.
+        
+    Note: The schema is validated once before any document is processed.
+    If validation fails, extraction will not proceed.
+    """
+    try:
+        if schema is not None:
+            errors = _validate_schema(schema)
+            if errors:
+                return f"Schema validation failed. Please fix the schema before extraction.\n{_format_schema_errors(errors)}"
+            schema_json = _schema_json(schema)
+            config_obj = _schema_parse_config(schema_json)
+            config_blob = b"schema:" + schema_json
+            formatter = _format_schema_response
+        else:
+            config_obj = None
+            config_blob = b"raw"
+            formatter = _format_raw_response
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def extract_one(pdf_base64: str) -> str:
+            # Decode inside the semaphore too, so at most max_concurrency decoded
+            # documents are held in memory at a time
+            async with semaphore:
+                # Share cache entries with the single-document tools
+                raw, cache_key, cached = await asyncio.to_thread(_lookup_base64, pdf_base64, config_blob)
+                if cached is not None:
+                    return cached
+                rendered = await _parse_in_pool(raw, config_obj, formatter)
+            if not rendered:
+                raise ValueError("No results returned")
+
+            cacheable, payload = rendered
+            if cacheable:
+                await asyncio.to_thread(_cache_put, cache_key, payload)
+            return payload
+
+        async def extract_indexed(index: int, pdf_base64: str) -> Tuple[int, Union[str, Exception]]:
+            try:
+                return index, await extract_one(pdf_base64)
+            except Exception as e:
+                return index, e
+
+        # Consume documents as they finish rather than waiting for the slowest one,
+        # reporting progress to the client after each so it sees the first result
+        # after the fastest document instead of the slowest
+        total = len(pdf_base64_list)
+        payloads: List[Union[str, Exception, None]] = [None] * total
+        tasks = [asyncio.create_task(extract_indexed(i, b)) for i, b in enumerate(pdf_base64_list)]
+        try:
+            for completed, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+                index, payload = await next_done
+                payloads[index] = payload
+                await ctx.report_progress(completed, total)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # Entries are already JSON, so the array is assembled without re-serializing them
+        items = [
+            _dumps({"error": f"Error during batch extraction: {str(p)}"}) if isinstance(p, Exception) else p
+            for p in payloads
+        ]
+        return "[" + ",".join(items) + "]"
+    except Exception as e:
+        return f"Error during batch extraction: {str(e)}"
+
 if __name__ == "__main__":
     """Main entry point for the MCP ADE Server.
     
@@ -538,4 +1350,5 @@ if __name__ == "__main__":
     Note: This server is designed to be run by MCP clients, not directly by users.
     """
     load_environment_variables()  # Load and validate API key
+    _redirect_stdio()             # Silence library output, keep the protocol stream
     mcp.run(transport='stdio')    # Start MCP server on stdio transport
@@ -0,0 +1,59 @@
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+# The server reads its configuration at import time, so point the response cache at
+# a throwaway directory and provide a dummy API key before importing it
+os.environ.setdefault("ADE_CACHE_DIR", tempfile.mkdtemp(prefix="ade-cache-"))
+os.environ.setdefault("VISION_AGENT_API_KEY", "test-key")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import mcp_ade_server  # noqa: E402
+from agentic_doc.common import ParsedDocument  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    """The server module."""
+    return mcp_ade_server
+
+
+@pytest.fixture
+def cache_dir(server, tmp_path, monkeypatch):
+    """Gives the test an empty response cache (memory and disk)."""
+    monkeypatch.setattr(server, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(server, "_MEMORY_CACHE", server._LRUCache(maxsize=4))
+    return tmp_path
+
+
+@pytest.fixture
+def fake_parse(server, monkeypatch):
+    """Replaces agentic-doc's parse() and records every document it is called with.
+    
+    The document content becomes the markdown of the result (b"remote" for URLs);
+    b"bad" raises and b"empty" comes back without results.
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def parse(document, config=None):
+        with lock:
+            calls.append(document)
+        if isinstance(document, str):
+            # URLs stand in for a download, anything else is a local path
+            document = b"remote" if document.startswith(("http://", "https://")) else Path(document).read_bytes()
+        if document == b"bad":
+            raise RuntimeError("bad document")
+        if document == b"empty":
+            return []
+        return [ParsedDocument(
+            markdown=document.decode(), chunks=[], start_page_idx=0, end_page_idx=0, doc_type="pdf"
+        )]
+
+    monkeypatch.setattr(server, "parse", parse)
+    monkeypatch.setattr(server, "_PARSE_PROCESSES", 0)
+    return calls
@@ -0,0 +1,107 @@
+import asyncio
+import base64
+import threading
+import time
+
+import orjson
+
+
+class FakeContext:
+    """Stands in for the MCP context, recording progress reports."""
+
+    def __init__(self):
+        self.progress = []
+
+    async def report_progress(self, progress, total):
+        self.progress.append((progress, total))
+
+
+def encode(document):
+    return base64.b64encode(document).decode()
+
+
+def run_batch(server, documents, **kwargs):
+    ctx = FakeContext()
+    response = asyncio.run(server.ade_extract_batch(ctx, documents, **kwargs))
+    return orjson.loads(response), ctx
+
+
+def test_entries_keep_input_order(server, cache_dir, fake_parse):
+    documents = [f"doc{i}".encode() for i in range(6)]
+    entries, _ = run_batch(server, [encode(d) for d in documents])
+    assert [entry["markdown"] for entry in entries] == [d.decode() for d in documents]
+    assert sorted(fake_parse) == sorted(documents)
+
+
+def test_failed_documents_become_error_entries(server, cache_dir, fake_parse):
+    entries, _ = run_batch(server, [encode(b"one"), encode(b"bad"), "not base64!", encode(b"empty")])
+    assert entries[0]["markdown"] == "one"
+    assert entries[1] == {"error": "Error during batch extraction: bad document"}
+    assert entries[2]["error"].startswith("Error during batch extraction: Invalid base64 document")
+    assert entries[3] == {"error": "Error during batch extraction: No results returned"}
+
+
+def test_batch_shares_the_single_document_cache(server, cache_dir, fake_parse):
+    single = asyncio.run(server.ade_extract_raw_chunks(None, encode(b"one")))
+    entries, _ = run_batch(server, [encode(b"one")])
+    assert entries == [orjson.loads(single)]
+    assert fake_parse == [b"one"]
+
+
+def test_invalid_schema_is_rejected_before_parsing(server, cache_dir, fake_parse):
+    response = asyncio.run(server.ade_extract_batch(FakeContext(), [encode(b"one")], schema={"type": "array"}))
+    assert response.startswith("Schema validation failed. Please fix the schema before extraction.\n")
+    assert fake_parse == []
+
+
+def test_max_concurrency_bounds_decoded_documents(server, cache_dir, fake_parse, monkeypatch):
+    lock = threading.Lock()
+    held = [0]
+    peak = [0]
+    lookup_base64 = server._lookup_base64
+    parse = server.parse
+
+    def counting_lookup(pdf_base64, config_blob):
+        result = lookup_base64(pdf_base64, config_blob)
+        with lock:
+            held[0] += 1
+            peak[0] = max(peak[0], held[0])
+        return result
+
+    def slow_parse(document, config=None):
+        time.sleep(0.02)
+        try:
+            return parse(document, config=config)
+        finally:
+            with lock:
+                held[0] -= 1
+
+    monkeypatch.setattr(server, "_lookup_base64", counting_lookup)
+    monkeypatch.setattr(server, "parse", slow_parse)
+    entries, _ = run_batch(server, [encode(f"doc{i}".encode()) for i in range(8)], max_concurrency=2)
+    assert len(entries) == 8
+    assert peak[0] <= 2
+
+
+def test_progress_is_reported_per_document(server, cache_dir, fake_parse):
+    entries, ctx = run_batch(server, [encode(b"one"), encode(b"bad"), encode(b"two")])
+    assert len(entries) == 3
+    assert ctx.progress == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_results_are_consumed_as_they_complete(server, cache_dir, fake_parse, monkeypatch):
+    parse = server.parse
+    finished = []
+
+    def slow_first(document, config=None):
+        # The first document is the slowest, so it must not hold back the others
+        if document == b"slow":
+            time.sleep(0.2)
+        finished.append(document)
+        return parse(document, config=config)
+
+    monkeypatch.setattr(server, "parse", slow_first)
+    entries, ctx = run_batch(server, [encode(b"slow"), encode(b"fast")])
+    assert finished == [b"fast", b"slow"]
+    assert [entry["markdown"] for entry in entries] == ["slow", "fast"]
+    assert ctx.progress == [(1, 2), (2, 2)]
@@ -0,0 +1,69 @@
+import asyncio
+
+import orjson
+
+
+def test_cache_key_separates_document_and_config(server):
+    assert server._cache_key(b"ab", b"c") != server._cache_key(b"a", b"bc")
+    assert server._cache_key(b"doc", b"raw") != server._cache_key(b"doc", b"markdown")
+    assert server._cache_key(b"doc", b"raw") == server._cache_key(b"doc", b"raw")
+
+
+def test_file_cache_key_matches_bytes_key(server, tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.4 test")
+    assert server._file_cache_key(str(path), b"raw") == server._cache_key(b"%PDF-1.4 test", b"raw")
+
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+    assert server._file_cache_key(str(empty), b"raw") == server._cache_key(b"", b"raw")
+
+
+def test_lru_cache_evicts_least_recently_used(server):
+    cache = server._LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_cache_round_trip(server, cache_dir):
+    assert server._cache_get("k") is None
+    server._cache_put("k", '{"markdown":"# hi"}')
+    assert server._cache_get("k") == '{"markdown":"# hi"}'
+    assert (cache_dir / "k.json").read_text(encoding="utf-8") == '{"markdown":"# hi"}'
+    assert not list(cache_dir.glob("*.tmp"))
+
+
+def test_cache_falls_back_to_disk_after_eviction(server, cache_dir):
+    for i in range(6):
+        server._cache_put(f"k{i}", f"payload {i}")
+    # The memory tier only holds the 4 most recent entries
+    assert "k0" not in server._MEMORY_CACHE
+    assert server._cache_get("k0") == "payload 0"
+    assert "k0" in server._MEMORY_CACHE
+
+
+def test_lookup_base64_serves_cached_response(server, cache_dir):
+    document, key, cached = server._lookup_base64("aGVsbG8=", b"raw")
+    assert document == b"hello"
+    assert cached is None
+    server._cache_put(key, "cached")
+    assert server._lookup_base64("aGVsbG8=", b"raw") == (b"hello", key, "cached")
+
+
+def test_urls_are_not_cached(server, cache_dir):
+    url = "https://example.com/a.pdf"
+    assert server._lookup_document(None, url, b"raw") == (url, None, None)
+
+
+def test_extract_from_url_passes_url_to_parse(server, cache_dir, fake_parse):
+    url = "https://example.com/a.pdf"
+    response = asyncio.run(server.ade_extract_from_path(None, url))
+    assert fake_parse == [url]
+    assert orjson.loads(response)["extraction_result"]["markdown"] == "remote"
+    assert not list(cache_dir.iterdir())
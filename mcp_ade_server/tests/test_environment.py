@@ -0,0 +1,27 @@
+import pytest
+
+
+@pytest.fixture
+def fresh_environment(server, monkeypatch):
+    """Counts .env loads and clears the cached result around the test."""
+    loads = []
+    monkeypatch.setattr(server, "load_dotenv", lambda: loads.append(True))
+    server.load_environment_variables.cache_clear()
+    yield loads
+    server.load_environment_variables.cache_clear()
+
+
+def test_env_file_is_loaded_once(server, fresh_environment, monkeypatch):
+    monkeypatch.setenv("VISION_AGENT_API_KEY", "key")
+    server.load_environment_variables()
+    server.load_environment_variables()
+    assert fresh_environment == [True]
+
+
+def test_missing_api_key_is_not_cached(server, fresh_environment, monkeypatch):
+    monkeypatch.delenv("VISION_AGENT_API_KEY")
+    with pytest.raises(ValueError, match="Missing required environment variable: VISION_AGENT_API_KEY"):
+        server.load_environment_variables()
+    monkeypatch.setenv("VISION_AGENT_API_KEY", "key")
+    server.load_environment_variables()
+    assert fresh_environment == [True, True]
@@ -0,0 +1,74 @@
+import asyncio
+from enum import Enum
+
+import orjson
+from agentic_doc.common import Chunk, ChunkGrounding, ChunkGroundingBox, ChunkType, ParsedDocument
+
+
+def sample_document():
+    """A document with grounded and ungrounded chunks of several types."""
+    box = ChunkGroundingBox(l=0.1, t=0.2, r=0.3, b=0.4)
+    chunks = [
+        Chunk(text="Title", chunk_type=ChunkType.text, chunk_id="c0", grounding=[ChunkGrounding(page=0, box=box)]),
+        Chunk(text="| a |", chunk_type=ChunkType.table, chunk_id="c1", grounding=[
+            ChunkGrounding(page=1, box=box), ChunkGrounding(page=2, box=box)
+        ]),
+        Chunk(text="Footer", chunk_type=ChunkType.marginalia, chunk_id="c2", grounding=[]),
+    ]
+    return ParsedDocument(markdown="# Title", chunks=chunks, start_page_idx=0, end_page_idx=2, doc_type="pdf")
+
+
+def baseline_raw_response(result):
+    """The response the original server built for ade_extract_raw_chunks."""
+    return {
+        "markdown": result.markdown,
+        "chunks": [
+            {
+                "type": chunk.chunk_type.value if hasattr(chunk, 'chunk_type') and hasattr(chunk.chunk_type, 'value') else str(chunk.chunk_type),
+                "content": chunk.text,
+                "page": chunk.grounding[0].page if chunk.grounding else None,
+                "chunk_id": chunk.chunk_id,
+                "grounding": [{"bbox": {"l": g.box.l, "t": g.box.t, "r": g.box.r, "b": g.box.b}, "page": g.page} for g in chunk.grounding] if chunk.grounding else []
+            } for chunk in result.chunks
+        ]
+    }
+
+
+def test_raw_response_matches_baseline(server):
+    document = sample_document()
+    response = server._format_raw_response(document)
+    assert response == baseline_raw_response(document)
+    # Key order is part of the response text
+    assert [list(chunk) for chunk in response["chunks"]] == [["type", "content", "page", "chunk_id", "grounding"]] * 3
+
+
+def test_serialized_raw_response_matches_baseline(server):
+    document = sample_document()
+    payload = server._dumps(server._format_raw_response(document))
+    assert orjson.loads(payload) == baseline_raw_response(document)
+
+
+def test_markdown_only_skips_chunks(server):
+    assert server._format_raw_response(sample_document(), include_chunks=False) == {
+        "markdown": "# Title", "chunks": None
+    }
+
+
+def test_markdown_only_tool(server, cache_dir, fake_parse):
+    response = asyncio.run(server.ade_extract_markdown_only(None, "ZG9j"))
+    assert orjson.loads(response) == {"markdown": "doc", "chunks": None}
+    # Cached separately from the full raw response
+    asyncio.run(server.ade_extract_raw_chunks(None, "ZG9j"))
+    assert asyncio.run(server.ade_extract_markdown_only(None, "ZG9j")) == response
+    assert fake_parse == [b"doc", b"doc"]
+
+
+def test_chunk_type_shape_is_read_from_the_chunk_model(server):
+    assert Chunk.model_fields["chunk_type"].annotation is ChunkType
+    assert server._CHUNK_TYPE_IS_ENUM is issubclass(ChunkType, Enum)
+
+
+def test_chunk_type_values(server):
+    for chunk_type in ChunkType:
+        chunk = Chunk(text="", chunk_type=chunk_type, chunk_id="c", grounding=[])
+        assert server._chunk_type_of(chunk) == chunk_type.value
@@ -0,0 +1,39 @@
+import asyncio
+
+import orjson
+from agentic_doc.common import ParsedDocument
+
+SCHEMA = {"type": "object", "properties": {"total": {"type": "number"}}}
+
+
+def test_validated_schema_is_passed_through(server, cache_dir, monkeypatch):
+    validated = []
+    configs = []
+    validate_schema = server._validate_schema
+
+    def spy_validate(schema):
+        validated.append(schema)
+        return validate_schema(schema)
+
+    def parse(document, config=None):
+        configs.append(config)
+        result = ParsedDocument(markdown="", chunks=[], start_page_idx=0, end_page_idx=0, doc_type="pdf")
+        result.extraction = {"total": 1.5}
+        return [result]
+
+    monkeypatch.setattr(server, "_validate_schema", spy_validate)
+    monkeypatch.setattr(server, "parse", parse)
+    first = asyncio.run(server.ade_extract_with_json_schema(None, "b25l", schema=SCHEMA))
+    asyncio.run(server.ade_extract_with_json_schema(None, "dHdv", schema=dict(reversed(list(SCHEMA.items())))))
+
+    assert validated == [SCHEMA, dict(reversed(list(SCHEMA.items())))]
+    assert configs[0].extraction_schema == SCHEMA
+    # Equal schemas share one config, whatever their key order
+    assert configs[1] is configs[0]
+    assert orjson.loads(first)["extracted_data"] == {"total": 1.5}
+
+
+def test_invalid_schema_is_not_extracted(server, cache_dir, fake_parse):
+    response = asyncio.run(server.ade_extract_with_json_schema(None, "b25l", schema={"type": "array"}))
+    assert response.startswith("Schema validation failed. Please fix the schema before extraction.\n❌ Schema validation failed:\n")
+    assert fake_parse == []
@@ -0,0 +1,100 @@
+import pytest
+from pydantic import BaseModel
+
+# Code the original server ran through exec() before looking up the last model
+BASELINE_PREFIX = "from pydantic import BaseModel, Field\nfrom typing import List, Optional\n\n"
+
+PLAIN_MODELS = [
+    "class Invoice(BaseModel):\n    number: str\n    total: float",
+    (
+        "from typing import List, Optional\n"
+        "from pydantic import BaseModel, Field\n\n"
+        "class Item(BaseModel):\n"
+        "    \"\"\"A line item.\"\"\"\n"
+        "    name: str = Field(description=\"Item name\")\n"
+        "    price: Optional[float] = None\n\n"
+        "class Invoice(BaseModel):\n"
+        "    number: str = Field(description=\"Invoice number\")\n"
+        "    items: List[Item] = Field(default_factory=list)\n"
+        "    paid: bool = False\n"
+    ),
+    "class A(BaseModel):\n    x: int | None = None\n    tags: list[str] = []\n\nclass B(A):\n    y: dict[str, int]",
+]
+
+
+def exec_model(code):
+    """Builds the extraction model by executing the code, like the original server.
+    
+    The code runs in one namespace (like a module), so helper models referenced in
+    annotations resolve the way the tool documents.
+    """
+    namespace = {}
+    exec(BASELINE_PREFIX + code, namespace)
+    for var in reversed(namespace.values()):
+        if isinstance(var, type) and issubclass(var, BaseModel) and var is not BaseModel:
+            return var
+    return None
+
+
+@pytest.mark.parametrize("code", PLAIN_MODELS)
+def test_ast_model_matches_exec(server, code):
+    built = server._build_model_from_ast(code)
+    assert built is not None
+    expected = exec_model(code)
+    assert built.__name__ == expected.__name__
+    assert built.model_json_schema() == expected.model_json_schema()
+
+
+def test_ast_builder_declines_code_needing_execution(server):
+    code = (
+        "class A(BaseModel):\n"
+        "    x: int\n"
+        "    def double(self):\n"
+        "        return self.x * 2\n"
+    )
+    assert server._build_model_from_ast(code) is None
+
+
+def test_ast_builder_never_evaluates_calls(server):
+    code = "class A(BaseModel):\n    x: int = __import__('os').getpid()\n"
+    assert server._build_model_from_ast(code) is None
+
+
+def test_ast_builder_rejects_invalid_code(server):
+    with pytest.raises(SyntaxError):
+        server._build_model_from_ast("class A(BaseModel)\n    x: int")
+
+
+@pytest.mark.parametrize("code", PLAIN_MODELS + [
+    "class A(BaseModel):\n    x: int\n    def double(self):\n        return self.x * 2\n",
+    "class Base(BaseModel):\n    x: int\n\nclass Last(Base):\n    y: str\n\nAlias = Last\n",
+])
+def test_load_extraction_model_matches_exec(server, code):
+    loaded = server._load_extraction_model(code)
+    expected = exec_model(code)
+    assert loaded.__name__ == expected.__name__
+    assert loaded.model_json_schema() == expected.model_json_schema()
+
+
+def test_load_extraction_model_is_cached(server):
+    code = "class Cached(BaseModel):\n    x: int\n    def f(self):\n        return 1\n"
+    assert server._load_extraction_model(code) is server._load_extraction_model(code)
+
+
+def test_load_extraction_model_without_model(server):
+    assert server._load_extraction_model("x = 1") is None
+
+
+def test_load_extraction_model_picks_last_class_by_name(server):
+    code = (
+        "class Item(BaseModel):\n    name: str\n\n"
+        "class Invoice(BaseModel):\n    items: List[dict]\n"
+        "    def count(self):\n        return len(self.items)\n\n"
+        "helper = Item\n"
+    )
+    assert server._load_extraction_model(code).__name__ == "Invoice"
+
+
+def test_load_extraction_model_falls_back_to_scope_scan(server):
+    code = "Dynamic = create_model('Dynamic', x=(int, ...))\n"
+    assert server._load_extraction_model(code).__name__ == "Dynamic"
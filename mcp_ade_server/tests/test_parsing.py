@@ -0,0 +1,47 @@
+import asyncio
+
+import orjson
+
+
+def parse_all(server, documents, formatter=None):
+    """Parses the documents concurrently and returns each result or exception."""
+    formatter = formatter or server._format_raw_response
+
+    async def main():
+        return await asyncio.gather(
+            *(server._parse_in_pool(document, None, formatter) for document in documents),
+            return_exceptions=True
+        )
+
+    return asyncio.run(main())
+
+
+def test_each_document_is_parsed_once(server, fake_parse):
+    results = parse_all(server, [b"one", b"two", b"three"])
+    assert sorted(fake_parse) == [b"one", b"three", b"two"]
+    assert [orjson.loads(payload)["markdown"] for _, payload in results] == ["one", "two", "three"]
+    assert all(cacheable for cacheable, _ in results)
+
+
+def test_failure_is_isolated_and_not_retried(server, fake_parse):
+    results = parse_all(server, [b"one", b"bad", b"two"])
+    assert sorted(fake_parse) == [b"bad", b"one", b"two"]
+    assert isinstance(results[1], RuntimeError)
+    assert orjson.loads(results[0][1])["markdown"] == "one"
+    assert orjson.loads(results[2][1])["markdown"] == "two"
+
+
+def test_formatter_failure_is_isolated(server, fake_parse):
+    def formatter(result):
+        if result.markdown == "two":
+            raise ValueError("cannot format")
+        return server._format_raw_response(result)
+
+    results = parse_all(server, [b"one", b"two"], formatter)
+    assert sorted(fake_parse) == [b"one", b"two"]
+    assert isinstance(results[1], ValueError)
+    assert orjson.loads(results[0][1])["markdown"] == "one"
+
+
+def test_empty_result(server, fake_parse):
+    assert parse_all(server, [b"empty"]) == [None]
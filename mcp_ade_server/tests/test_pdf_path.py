@@ -0,0 +1,53 @@
+import asyncio
+import base64
+
+import orjson
+
+
+def test_path_is_handed_to_parse(server, cache_dir, fake_parse, tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"from disk")
+    response = asyncio.run(server.ade_extract_raw_chunks(None, pdf_path=str(path)))
+    assert fake_parse == [str(path)]
+    assert orjson.loads(response)["markdown"] == "from disk"
+
+
+def test_path_and_base64_share_cache_entries(server, cache_dir, fake_parse, tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"same document")
+    from_path = asyncio.run(server.ade_extract_raw_chunks(None, pdf_path=str(path)))
+    from_base64 = asyncio.run(server.ade_extract_raw_chunks(None, base64.b64encode(b"same document").decode()))
+    assert from_base64 == from_path
+    assert len(fake_parse) == 1
+
+
+def test_path_is_preferred_over_base64(server, cache_dir, fake_parse, tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"from disk")
+    response = asyncio.run(server.ade_extract_markdown_only(None, "aWdub3JlZA==", pdf_path=str(path)))
+    assert orjson.loads(response)["markdown"] == "from disk"
+
+
+def test_every_extraction_tool_accepts_a_path(server, cache_dir, fake_parse, tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"from disk")
+    schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+    responses = [
+        asyncio.run(server.ade_extract_raw_chunks(None, pdf_path=str(path))),
+        asyncio.run(server.ade_extract_markdown_only(None, pdf_path=str(path))),
+        asyncio.run(server.ade_extract_with_json_schema(None, schema=schema, pdf_path=str(path))),
+        asyncio.run(server.ade_extract_with_pydantic(None, pydantic_model_code="class A(BaseModel):\n    a: str", pdf_path=str(path))),
+    ]
+    assert all(response.startswith("{") for response in responses)
+    assert fake_parse == [str(path)] * 4
+
+
+def test_missing_file(server, cache_dir, fake_parse):
+    assert asyncio.run(server.ade_extract_raw_chunks(None, pdf_path="/no/such/doc.pdf")) == "❌ File not found: /no/such/doc.pdf"
+    assert asyncio.run(server.ade_extract_from_path(None, "/no/such/doc.pdf")) == "❌ File not found: /no/such/doc.pdf"
+    assert fake_parse == []
+
+
+def test_missing_document(server, cache_dir, fake_parse):
+    response = asyncio.run(server.ade_extract_raw_chunks(None))
+    assert response == "Error during raw extraction: Either pdf_base64 or pdf_path must be provided"
@@ -0,0 +1,39 @@
+import pytest
+from agentic_doc.common import Chunk, ChunkType, ParsedDocument
+
+
+def document_with_chunks(count):
+    chunks = [Chunk(text=f"t{i}", chunk_type=ChunkType.text, chunk_id=f"c{i}", grounding=[]) for i in range(count)]
+    return ParsedDocument(markdown="# doc", chunks=chunks, start_page_idx=0, end_page_idx=0, doc_type="pdf")
+
+
+@pytest.fixture
+def pretty(server, monkeypatch):
+    monkeypatch.setattr(server, "_PRETTY_JSON", True)
+
+
+def test_cache_key_depends_on_pretty_json(server, monkeypatch):
+    monkeypatch.setattr(server, "_PRETTY_JSON", False)
+    compact = server._cache_key(b"doc", b"raw")
+    monkeypatch.setattr(server, "_PRETTY_JSON", True)
+    assert server._cache_key(b"doc", b"raw") != compact
+
+
+def test_responses_are_compact_by_default(server, monkeypatch):
+    monkeypatch.setattr(server, "_PRETTY_JSON", False)
+    monkeypatch.setattr(server, "parse", lambda document, config=None: [document_with_chunks(2)])
+    _, payload = server._parse_and_render(b"doc", None, server._format_raw_response)
+    assert "\n" not in payload
+
+
+def test_small_responses_are_indented(server, pretty, monkeypatch):
+    monkeypatch.setattr(server, "parse", lambda document, config=None: [document_with_chunks(2)])
+    _, payload = server._parse_and_render(b"doc", None, server._format_raw_response)
+    assert payload.startswith('{\n  "markdown": "# doc",')
+
+
+def test_large_responses_stay_compact(server, pretty, monkeypatch):
+    count = server._PRETTY_JSON_MAX_CHUNKS + 1
+    monkeypatch.setattr(server, "parse", lambda document, config=None: [document_with_chunks(count)])
+    _, payload = server._parse_and_render(b"doc", None, server._format_raw_response)
+    assert "\n" not in payload
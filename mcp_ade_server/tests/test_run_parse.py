@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from agentic_doc.common import PageError, ParsedDocument
+
+DOC = "ZG9j"  # base64 of b"doc"
+
+
+def run_parse(server, **kwargs):
+    return asyncio.run(server._run_parse(DOC, None, b"test", **kwargs))
+
+
+def test_response_is_cached(server, cache_dir, fake_parse):
+    first = run_parse(server)
+    assert run_parse(server) == first
+    assert fake_parse == [b"doc"]
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+
+@pytest.mark.parametrize("failure", [
+    {"errors": [PageError(page_num=0, error="timeout", error_code=504)]},
+    {"extraction_error": "schema mismatch"},
+])
+def test_responses_with_errors_are_not_cached(server, cache_dir, monkeypatch, failure):
+    calls = []
+
+    def parse(document, config=None):
+        calls.append(document)
+        return [ParsedDocument(
+            markdown="partial", chunks=[], start_page_idx=0, end_page_idx=0, doc_type="pdf", **failure
+        )]
+
+    monkeypatch.setattr(server, "parse", parse)
+    run_parse(server)
+    run_parse(server)
+    assert len(calls) == 2
+    assert not list(cache_dir.iterdir())
+
+
+def test_no_results_message(server, cache_dir, fake_parse):
+    empty = "ZW1wdHk="  # base64 of b"empty"
+    assert asyncio.run(server._run_parse(empty, None, b"test")) == "❌ No results returned"
+    assert asyncio.run(server._run_parse(empty, None, b"test", no_results="❌ Nothing.")) == "❌ Nothing."
+
+
+def test_no_config_message(server, cache_dir, fake_parse):
+    response = run_parse(server, config=lambda: None, no_config="❌ No config.")
+    assert response == "❌ No config."
+    assert fake_parse == []
+
+
+def test_config_is_only_built_on_cache_miss(server, cache_dir, fake_parse):
+    built = []
+
+    def config():
+        built.append(True)
+        return None
+
+    run_parse(server, config=config)
+    run_parse(server, config=config)
+    assert len(built) == 1
+
+
+def test_errors_are_reported_with_task_name(server, cache_dir, fake_parse):
+    bad = "YmFk"  # base64 of b"bad"
+    response = asyncio.run(server._run_parse(bad, None, b"test", task="raw extraction"))
+    assert response == "Error during raw extraction: bad document"
+
+
+def test_tool_messages(server, cache_dir, fake_parse):
+    empty = "ZW1wdHk="
+    schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+    assert asyncio.run(server.ade_extract_raw_chunks(None, empty)) == "❌ No results returned"
+    assert asyncio.run(server.ade_extract_with_json_schema(None, empty, schema=schema)) == "❌ No results returned."
+    model_code = "class A(BaseModel):\n    x: int"
+    assert asyncio.run(server.ade_extract_with_pydantic(None, empty, pydantic_model_code=model_code)) == (
+        "❌ No results returned from parsing."
+    )
+    assert asyncio.run(server.ade_extract_with_pydantic(None, DOC, pydantic_model_code="x = 1")) == (
+        "❌ No Pydantic BaseModel class found in the provided code."
+    )
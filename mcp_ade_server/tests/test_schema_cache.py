@@ -0,0 +1,48 @@
+import asyncio
+import json
+
+import pytest
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"x": {"type": ["object", "string"]}, "y": {"type": "array"}},
+    "allOf": [{"not": {"type": "string"}}],
+}
+
+# orjson only handles 64-bit integers
+BIG_INT_SCHEMA = {"type": "object", "properties": {"a": {"type": "integer", "maximum": 10 ** 30}}}
+
+
+def test_cached_verdict_ignores_key_order(server):
+    first = server._validate_schema(SCHEMA)
+    reordered = dict(reversed(list(SCHEMA.items())))
+    assert server._schema_digest(reordered) == server._schema_digest(SCHEMA)
+    assert server._validate_schema(reordered) == first
+    assert len(first) == 4
+
+
+def test_schema_json_is_canonical(server):
+    assert server._schema_json({"b": 1, "a": [2, 3]}) == b'{"a":[2,3],"b":1}'
+
+
+@pytest.mark.parametrize("schema", [SCHEMA, BIG_INT_SCHEMA])
+def test_schema_json_round_trips(server, schema):
+    assert json.loads(server._schema_json(schema)) == schema
+
+
+def test_big_integer_schema_is_validated(server):
+    assert server._validate_schema(BIG_INT_SCHEMA) == ()
+    message = asyncio.run(server.ade_validate_json_schema(None, BIG_INT_SCHEMA))
+    assert message == "✅ Schema is valid according to ADE documentation rules."
+
+
+def test_big_integer_schema_config_keeps_exact_values(server):
+    config = server._schema_parse_config(server._schema_json(BIG_INT_SCHEMA))
+    assert config.extraction_schema == BIG_INT_SCHEMA
+    assert config.extraction_schema["properties"]["a"]["maximum"] == 10 ** 30
+
+
+def test_big_integer_schema_extracts(server, cache_dir, fake_parse):
+    response = asyncio.run(server.ade_extract_with_json_schema(None, "ZG9j", schema=BIG_INT_SCHEMA))
+    assert fake_parse == [b"doc"]
+    assert "extracted_data" in json.loads(response)
@@ -0,0 +1,115 @@
+import pytest
+
+# Verdicts of the original recursive validator, which _validate_schema must keep
+# reproducing exactly (as a set: duplicates were always dropped)
+BASELINE_VERDICTS = [
+    (
+        {"type": "object", "properties": {"name": {"type": "string"}}},
+        set(),
+    ),
+    (
+        {"type": "array"},
+        {
+            "Rule Broken: Top-level 'type' must be 'object'.",
+            "Rule Broken: Array at path 'root' must have an 'items' field.",
+        },
+    ),
+    (
+        {"type": "object"},
+        {"Rule Broken: Object at path 'root' must have a 'properties' field."},
+    ),
+    (
+        {
+            "type": "object",
+            "properties": {"x": {"type": ["object", "string"]}, "y": {"type": "array"}},
+            "allOf": [{"not": {"type": "string"}}],
+        },
+        {
+            "Rule Broken: Array at path 'root.properties.y' must have an 'items' field.",
+            "Rule Broken: Prohibited keyword 'allOf' found at path 'root.allOf'.",
+            "Rule Broken: Prohibited keyword 'not' found at path 'root.allOf[0].not'.",
+            "Rule Broken: Type array at path 'root.properties.x.type' cannot contain 'object' or 'array'. Use 'anyOf' instead.",
+        },
+    ),
+    (
+        {"type": "object", "properties": {"a": {"type": "object", "properties": {"b": {"type": "string"}}}}},
+        {"Rule Broken: Schema depth exceeds 5 at path 'root.properties.a.properties.b.type'."},
+    ),
+    (
+        # The documented invoice example: nested item fields sit past the depth limit
+        {
+            "type": "object",
+            "properties": {
+                "invoice_number": {"type": "string"},
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"name": {"type": "string"}, "price": {"type": "number"}},
+                    },
+                },
+            },
+        },
+        {
+            "Rule Broken: Schema depth exceeds 5 at path 'root.properties.items.items.properties.name'.",
+            "Rule Broken: Schema depth exceeds 5 at path 'root.properties.items.items.properties.price'.",
+        },
+    ),
+    (
+        {
+            "type": "object",
+            "properties": {
+                "v": {"anyOf": [{"if": {"type": "string"}, "then": {"type": "string"}, "else": {"type": "null"}}]}
+            },
+        },
+        {
+            "Rule Broken: Prohibited keyword 'if' found at path 'root.properties.v.anyOf[0].if'.",
+            "Rule Broken: Prohibited keyword 'then' found at path 'root.properties.v.anyOf[0].then'.",
+            "Rule Broken: Prohibited keyword 'else' found at path 'root.properties.v.anyOf[0].else'.",
+            "Rule Broken: Schema depth exceeds 5 at path 'root.properties.v.anyOf[0].if'.",
+            "Rule Broken: Schema depth exceeds 5 at path 'root.properties.v.anyOf[0].then'.",
+            "Rule Broken: Schema depth exceeds 5 at path 'root.properties.v.anyOf[0].else'.",
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize("schema,expected", BASELINE_VERDICTS)
+def test_validate_schema_matches_baseline(server, schema, expected):
+    errors = server._validate_schema(schema)
+    assert len(errors) == len(set(errors))
+    assert set(errors) == expected
+
+
+def test_format_schema_errors(server):
+    message = server._format_schema_errors(("Rule Broken: a.", "Rule Broken: b."))
+    assert message == "❌ Schema validation failed:\n- Rule Broken: a.\n- Rule Broken: b."
+
+
+@pytest.mark.parametrize("keyword", ["allOf", "not", "dependentRequired", "dependentSchemas", "if", "then", "else"])
+def test_every_prohibited_keyword_is_reported(server, keyword):
+    schema = {"type": "object", "properties": {"a": {"type": "string", keyword: {}}}}
+    assert set(server._validate_schema(schema)) == {
+        f"Rule Broken: Prohibited keyword '{keyword}' found at path 'root.properties.a.{keyword}'."
+    }
+
+
+def test_prohibited_keyword_as_property_name_is_reported(server):
+    # Like the original validator, any key with a prohibited name counts, even a property name
+    schema = {"type": "object", "properties": {"if": {"type": "string"}}}
+    assert set(server._validate_schema(schema)) == {
+        "Rule Broken: Prohibited keyword 'if' found at path 'root.properties.if'."
+    }
+
+
+def test_repeated_violations_are_reported_once(server):
+    # The original validator appended the object rule once per key of the object
+    schema = {"type": "object", "title": "Invoice", "description": "An invoice"}
+    assert server._validate_schema(schema) == ("Rule Broken: Object at path 'root' must have a 'properties' field.",)
+
+
+def test_wide_schema_reports_each_violation_once(server):
+    properties = {f"p{i}": {"type": "array", "description": "no items"} for i in range(200)}
+    errors = server._validate_schema({"type": "object", "properties": properties})
+    assert len(errors) == 200
+    assert set(errors) == {f"Rule Broken: Array at path 'root.properties.p{i}' must have an 'items' field." for i in range(200)}
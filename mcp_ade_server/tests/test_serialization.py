@@ -0,0 +1,66 @@
+import json
+from datetime import date
+from typing import List
+
+import orjson
+from agentic_doc.common import ParsedDocument
+from pydantic import BaseModel, v1
+
+
+def test_output_is_compact_by_default(server):
+    response = {"markdown": "# doc", "chunks": [{"type": "text", "page": None}]}
+    assert server._dumps(response) == '{"markdown":"# doc","chunks":[{"type":"text","page":null}]}'
+
+
+def test_pretty_output_matches_indented_json(server):
+    response = {"markdown": "# doc", "chunks": [{"type": "text", "page": None}]}
+    assert server._dumps(response, pretty=True) == json.dumps(response, indent=2)
+
+
+def test_non_string_keys_are_stringified(server):
+    assert orjson.loads(server._dumps({1: "a", None: "b", 2.5: "c"})) == {"1": "a", "null": "b", "2.5": "c"}
+
+
+def test_unknown_values_are_stringified(server):
+    class Opaque:
+        def __str__(self):
+            return "opaque"
+
+    assert server._dumps({"value": Opaque()}) == '{"value":"opaque"}'
+
+
+def test_pydantic_models_are_dumped_in_json_mode(server):
+    class Item(BaseModel):
+        name: str
+        due: date
+
+    class Invoice(BaseModel):
+        items: List[Item]
+
+    invoice = Invoice(items=[Item(name="a", due=date(2024, 1, 31))])
+    expected = {"extracted_data": {"items": [{"name": "a", "due": "2024-01-31"}]}}
+    assert orjson.loads(server._dumps({"extracted_data": invoice})) == expected
+    assert orjson.loads(server._dumps({"extracted_data": invoice}, pretty=True)) == expected
+
+
+def test_pydantic_v1_models_fall_back_to_dict(server):
+    class Legacy(v1.BaseModel):
+        total: float
+        tags: list
+
+    assert orjson.loads(server._dumps({"extracted_data": Legacy(total=1.5, tags=["x"])})) == {
+        "extracted_data": {"total": 1.5, "tags": ["x"]}
+    }
+
+
+def test_pydantic_response_keeps_the_model_until_serialization(server):
+    class Extracted(BaseModel):
+        total: float
+
+    result = ParsedDocument(markdown="", chunks=[], start_page_idx=0, end_page_idx=0, doc_type="pdf")
+    result.extraction = Extracted(total=2.0)
+    response = server._format_pydantic_response(result)
+    assert response["extracted_data"] is result.extraction
+    assert orjson.loads(server._dumps(response)) == {
+        "extraction_error": None, "extracted_data": {"total": 2.0}, "field_details": {}
+    }